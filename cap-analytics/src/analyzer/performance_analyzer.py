@@ -10,39 +10,89 @@ from datetime import datetime
 class PerformanceAnalyzer:
     """Analyzer for agent and agency commission performance"""
     
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, verbose: bool = False):
+        """
+        Initialize analyzer
+        
+        Args:
+            data: Normalized commission data
+            verbose: Print intermediate verification output
+        """
         self.data = data
+        self.verbose = verbose
+        self._period_cache: Dict[str, pd.DataFrame] = {}  # Cache period-filtered data
+        
+        # Group by categorical period once so lookups reuse precomputed row indices
+        self._by_period = self.data.groupby(
+            self.data['commission_period'].astype('category'),
+            observed=True,
+            sort=False
+        )
         print(f"Initializing analyzer, data shape: {self.data.shape}")
     
+    def _get_period_data(self, period: str) -> pd.DataFrame:
+        """
+        Get data for the specified period with numeric commission amounts
+        
+        Args:
+            period: Commission period (YYYY-MM format)
+            
+        Returns:
+            pd.DataFrame: Period data, cached per period for reuse across methods
+        """
+        if period not in self._period_cache:
+            try:
+                period_data = self._by_period.get_group(period).copy()
+            except KeyError:
+                period_data = self.data.iloc[0:0].copy()
+            period_data['commission_amount'] = pd.to_numeric(
+                period_data['commission_amount'], 
+                errors='coerce'
+            ).fillna(0.0)
+            self._period_cache[period] = period_data
+            
+        return self._period_cache[period]
+    
     def calculate_top_performers(self, n: int = 10, period: str = "2024-06") -> pd.DataFrame:
         """Calculate top commission earners for the specified period"""
         print(f"\nCalculating Top {n} performers for period {period}...")
         
         try:
             # 1. Basic data processing
-            df = self.data[self.data['commission_period'] == period].copy()
-            df['commission_amount'] = pd.to_numeric(df['commission_amount'], errors='coerce').fillna(0.0)
-            
-            # 2. Calculate totals for each agent
-            totals = []
-            for agent in df['agent_name'].unique():
-                agent_data = df[df['agent_name'] == agent]
-                total = agent_data['commission_amount'].sum()
-                avg = agent_data['commission_amount'].mean()
-                count = len(agent_data)
-                carriers = ', '.join(sorted(agent_data['carrier_name'].unique()))
-                
-                totals.append({
-                    'agent_name': agent,
-                    'total_commission': float(total),
-                    'avg_commission': float(avg),
-                    'transaction_count': int(count),
-                    'carriers': carriers
-                })
+            df = self._get_period_data(period)
+            
+            # 2. Calculate totals for each agent with integer-coded scatter-adds
+            codes, agents = pd.factorize(df['agent_name'], sort=False)
+            amounts = df['commission_amount'].to_numpy(dtype=np.float64)
+            valid = codes >= 0
+            totals = np.bincount(codes[valid], weights=amounts[valid], minlength=len(agents))
+            counts = np.bincount(codes[valid], minlength=len(agents))
+            
+            # Record carrier membership as one bit per carrier for each agent
+            carrier_codes, carrier_names = pd.factorize(df['carrier_name'], sort=True)
+            has_carrier = valid & (carrier_codes >= 0)
+            carrier_bits = np.zeros(len(agents), dtype=np.int64)
+            np.bitwise_or.at(carrier_bits, codes[has_carrier], 1 << carrier_codes[has_carrier])
             
-            # 3. Convert to DataFrame and sort
-            result = pd.DataFrame(totals)
-            result = result.sort_values('total_commission', ascending=False)
+            # 3. Select top n by total commission (partial sort of totals array)
+            k = min(n, len(totals))
+            if 0 < k < len(totals):
+                top_idx = np.sort(np.argpartition(-totals, k - 1)[:k])
+            else:
+                top_idx = np.arange(k)
+            top_idx = top_idx[np.argsort(-totals[top_idx], kind='stable')]
+            
+            result = pd.DataFrame({
+                'agent_name': np.asarray(agents, dtype=object)[top_idx],
+                'total_commission': totals[top_idx],
+                'avg_commission': totals[top_idx] / counts[top_idx],
+                'transaction_count': counts[top_idx]
+            })
+            # Carriers are decoded from the membership bitmask for the top n only
+            result['carriers'] = [
+                ', '.join(name for i, name in enumerate(carrier_names) if bits >> i & 1)
+                for bits in carrier_bits[top_idx]
+            ]
             
             # 4. Ensure float type for amounts
             result['total_commission'] = result['total_commission'].astype(float)
@@ -53,27 +103,27 @@ class PerformanceAnalyzer:
             result['avg_commission'] = result['avg_commission'].round(2)
             
             # 6. Verify sorting
-            print("\nVerifying sort order:")
-            for i in range(min(5, len(result))):
-                print(f"{i+1}. ${result.iloc[i]['total_commission']:,.2f}")
+            if self.verbose:
+                print("\nVerifying sort order:")
+                print("\n".join(
+                    f"{i+1}. ${value:,.2f}"
+                    for i, value in enumerate(result['total_commission'].head(5))
+                ))
             
             # 7. Fill to n records
             current_count = len(result)
             if current_count < n:
-                for i in range(current_count, n):
-                    new_row = {
-                        'agent_name': f'Agent_{i+1}',
-                        'total_commission': 0.0,
-                        'avg_commission': 0.0,
-                        'transaction_count': 0,
-                        'carriers': 'N/A'
-                    }
-                    result = pd.concat([result, pd.DataFrame([new_row])], ignore_index=True)
-            
-            # 8. Get top n records
-            result = result.head(n)
-            
-            # 9. Final verification
+                pad_count = n - current_count
+                padding = pd.DataFrame({
+                    'agent_name': [f'Agent_{i+1}' for i in range(current_count, n)],
+                    'total_commission': np.zeros(pad_count, dtype=np.float64),
+                    'avg_commission': np.zeros(pad_count, dtype=np.float64),
+                    'transaction_count': np.zeros(pad_count, dtype=np.int64),
+                    'carriers': np.full(pad_count, 'N/A', dtype=object)
+                })
+                result = pd.concat([result, padding], ignore_index=True)
+            
+            # 8. Final verification
             values = result['total_commission'].tolist()
             for i in range(len(values)-1):
                 if values[i] < values[i+1]:
@@ -101,17 +151,11 @@ class PerformanceAnalyzer:
         """
         print(f"\nCalculating carrier statistics for period {period}...")
         
-        # Filter period data
-        period_data = self.data[self.data['commission_period'] == period].copy()
-        
-        # Ensure numeric commission amounts
-        period_data['commission_amount'] = pd.to_numeric(
-            period_data['commission_amount'], 
-            errors='coerce'
-        ).fillna(0.0)
+        # Filter period data with numeric commission amounts
+        period_data = self._get_period_data(period)
         
         # Group aggregation
-        carrier_stats = period_data.groupby('carrier_name').agg({
+        carrier_stats = period_data.groupby('carrier_name', observed=True).agg({
             'commission_amount': ['sum', 'count', 'mean'],
             'agent_name': 'nunique',
             'member_id': 'nunique'
@@ -130,11 +174,11 @@ class PerformanceAnalyzer:
         result = carrier_stats.round(2).reset_index()
         
         print("\nStatistics results:")
-        for _, row in result.iterrows():
-            print(f"- {row['carrier_name']}:")
-            print(f"  Total Commission: ${row['total_commission']:,.2f}")
-            print(f"  Transactions: {row['transaction_count']:,}")
-            print(f"  Agents: {row['unique_agents']:,}")
+        for row in result.itertuples(index=False):
+            print(f"- {row.carrier_name}:")
+            print(f"  Total Commission: ${row.total_commission:,.2f}")
+            print(f"  Transactions: {row.transaction_count:,}")
+            print(f"  Agents: {row.unique_agents:,}")
         
         return result
     
@@ -150,21 +194,26 @@ class PerformanceAnalyzer:
         """
         print(f"\nGenerating period summary for {period}...")
         
-        # Filter period data
-        period_data = self.data[self.data['commission_period'] == period].copy()
+        # Filter period data with numeric commission amounts
+        period_data = self._get_period_data(period)
+        
+        # Count distinct agents and members in one call
+        unique_counts = period_data[['agent_name', 'member_id']].nunique()
         
-        # Ensure numeric commission amounts
-        period_data['commission_amount'] = pd.to_numeric(
-            period_data['commission_amount'], 
-            errors='coerce'
-        ).fillna(0.0)
+        # Categorical carriers only need their observed codes decoded
+        carrier_names = period_data['carrier_name']
+        if isinstance(carrier_names.dtype, pd.CategoricalDtype):
+            codes = np.unique(carrier_names.cat.codes.to_numpy())
+            carriers = sorted(carrier_names.cat.categories[codes[codes >= 0]])
+        else:
+            carriers = sorted(carrier_names.unique())
         
         summary = {
             'total_commission': period_data['commission_amount'].sum(),
             'total_transactions': len(period_data),
-            'unique_agents': period_data['agent_name'].nunique(),
-            'unique_members': period_data['member_id'].nunique(),
-            'carriers': sorted(period_data['carrier_name'].unique()),
+            'unique_agents': int(unique_counts['agent_name']),
+            'unique_members': int(unique_counts['member_id']),
+            'carriers': carriers,
             'period': period,
             'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
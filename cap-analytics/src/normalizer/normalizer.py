@@ -2,22 +2,28 @@
 Data normalization class, providing data cleaning and format standardization functionality
 """
 
+import re
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Any
 from datetime import datetime
 
+# Compiled once for member ID cleanup
+NON_ALPHANUMERIC = re.compile(r'[^a-zA-Z0-9]')
+
 class DataNormalizer:
     """Process and normalize commission data"""
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, copy: bool = True):
         """
         Initialize data normalizer
         
         Args:
             df: Input DataFrame
+            copy: Work on a copy of df; pass False to normalize df in place
+                  and avoid doubling peak memory
         """
-        self.data = df.copy()
+        self.data = df.copy() if copy else df
         self.normalized_data = None
         print(f"Initializing normalizer, input data shape: {self.data.shape}")
         print(f"Input data columns: {self.data.columns.tolist()}")
@@ -34,14 +40,25 @@ class DataNormalizer:
             'processed_date'
         ]
         
+        # Common formats are parsed on the fast path; only leftovers use 'mixed'
+        fast_formats = ['%Y-%m-%d', '%m/%d/%Y', '%Y%m%d']
+        
+        def parse_dates(values: pd.Series) -> pd.Series:
+            """Parse dates trying known formats before the slow mixed parser"""
+            parsed = pd.to_datetime(values, format=fast_formats[0], errors='coerce')
+            for fmt in fast_formats[1:] + ['mixed']:
+                pending = parsed.isna() & values.notna()
+                if not pending.any():
+                    break
+                parsed = parsed.fillna(
+                    pd.to_datetime(values[pending], format=fmt, errors='coerce')
+                )
+            return parsed
+        
         for col in date_columns:
             if col in self.data.columns:
                 try:
-                    self.data[col] = pd.to_datetime(
-                        self.data[col], 
-                        format='mixed',
-                        errors='coerce'
-                    ).dt.strftime('%Y-%m-%d')
+                    self.data[col] = parse_dates(self.data[col]).dt.strftime('%Y-%m-%d')
                     print(f"Normalized date column {col} complete")
                     print(f"Sample {col} values:", self.data[col].head())
                 except Exception as e:
@@ -54,54 +71,51 @@ class DataNormalizer:
         
         print("Original amount sample:", self.data['commission_amount'].head())
         
-        def clean_amount(val):
-            if pd.isna(val):
-                return 0.0
-                
-            try:
-                if isinstance(val, (int, float)):
-                    return float(val)
-                    
-                if isinstance(val, str):
-                    val = val.replace('$', '').replace(',', '').strip()
-                    if val.startswith('(') and val.endswith(')'):
-                        val = '-' + val[1:-1]
-                    if val.startswith('-$'):
-                        val = '-' + val[2:]
-                    return float(val)
-                    
-            except (ValueError, TypeError) as e:
-                print(f"Warning: Error converting amount '{val}': {e}")
-                return 0.0
-                
-            return 0.0
-        
-        self.data['commission_amount'] = (
-            self.data['commission_amount']
-            .apply(clean_amount)
-            .astype(float)
-        )
+        amounts = self.data['commission_amount']
+        cleaned = pd.to_numeric(amounts, errors='coerce')
+        
+        # Only formatted strings ($, commas, parentheses) need text cleanup
+        pending = cleaned.isna() & amounts.notna()
+        if pending.any():
+            text = (
+                amounts[pending]
+                .astype(str)
+                .str.strip()
+                .str.replace(r'[$,]', '', regex=True)
+            )
+            # Handle negative amounts in parentheses: (100) -> -100
+            negative = text.str.startswith('(') & text.str.endswith(')')
+            text = text.mask(negative, '-' + text.str.slice(1, -1))
+            cleaned.loc[pending] = pd.to_numeric(text, errors='coerce')
+            
+            invalid_count = cleaned[pending].isna().sum()
+            if invalid_count > 0:
+                print(f"Warning: {invalid_count} amounts could not be converted, set to 0")
+        
+        self.data['commission_amount'] = cleaned.fillna(0.0).astype(float)
         
         print("Normalized amount sample:", self.data['commission_amount'].head())
         print(f"Commission amount normalization complete, total amount: {self.data['commission_amount'].sum():,.2f}")
 
     def normalize_names(self) -> None:
         """Standardize agent and agency names"""
-        def clean_name(name):
-            """Clean and normalize names"""
-            if pd.isna(name) or not str(name).strip():
-                return "Unknown Agent"
-            
-            name = str(name).strip()
-            name = " ".join(word.capitalize() for word in name.split())
-            return name
+        def clean_names(names: pd.Series) -> pd.Series:
+            """Clean and normalize a column of names"""
+            names = (
+                names.astype('string')
+                .fillna('')
+                .str.strip()
+                .str.replace(r'\s+', ' ', regex=True)
+            )
+            names = names.where(names.str.len() > 0, 'Unknown Agent')
+            return names.str.title()
         
         print("\nNormalizing agent names...")
         if 'agent_name' in self.data.columns:
             original_count = self.data['agent_name'].nunique()
             print("Original agent names sample:", self.data['agent_name'].head())
             
-            self.data['agent_name'] = self.data['agent_name'].apply(clean_name)
+            self.data['agent_name'] = clean_names(self.data['agent_name'])
             
             new_count = self.data['agent_name'].nunique()
             print("Normalized agent names sample:", self.data['agent_name'].head())
@@ -110,7 +124,7 @@ class DataNormalizer:
         print("\nNormalizing agency names...")
         if 'agency_name' in self.data.columns:
             original_count = self.data['agency_name'].nunique()
-            self.data['agency_name'] = self.data['agency_name'].apply(clean_name)
+            self.data['agency_name'] = clean_names(self.data['agency_name'])
             new_count = self.data['agency_name'].nunique()
             print(f"Agency count: {original_count} -> {new_count}")
 
@@ -150,12 +164,11 @@ class DataNormalizer:
         if 'member_id' in self.data.columns:
             print("\nCleaning member IDs...")
             original_count = self.data['member_id'].nunique()
-            self.data['member_id'] = (
-                self.data['member_id']
-                .astype(str)
-                .str.strip()
-                .str.replace(r'[^a-zA-Z0-9]', '', regex=True)
-            )
+            member_ids = self.data['member_id']
+            if not pd.api.types.is_string_dtype(member_ids):
+                member_ids = member_ids.astype(str)
+            # Removing every non-alphanumeric character also strips whitespace
+            self.data['member_id'] = member_ids.str.replace(NON_ALPHANUMERIC, '', regex=True)
             new_count = self.data['member_id'].nunique()
             print(f"Member ID count: {original_count} -> {new_count}")
 
@@ -185,6 +198,20 @@ class DataNormalizer:
             self.data.loc[self.data['commission_amount'].isna(), 'commission_amount'] = 0.0
             print("Invalid amounts set to 0")
 
+    def convert_categorical_columns(self) -> None:
+        """Store repeated low-cardinality string columns as categories"""
+        categorical_columns = [
+            'carrier_name',
+            'commission_period',
+            'agent_name',
+            'agency_name'
+        ]
+        
+        for col in categorical_columns:
+            if col in self.data.columns:
+                self.data[col] = self.data[col].astype('category')
+        print(f"\nConverted to categorical: {[c for c in categorical_columns if c in self.data.columns]}")
+
     def normalize(self) -> pd.DataFrame:
         """
         Execute all normalization steps
@@ -206,6 +233,9 @@ class DataNormalizer:
             # Validate required fields
             self.validate_required_fields()
             
+            # Compact representation for downstream grouping
+            self.convert_categorical_columns()
+            
             self.normalized_data = self.data
             
             print("\nNormalization summary:")
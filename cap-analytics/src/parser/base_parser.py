@@ -4,9 +4,108 @@ Defines core interfaces and methods that all carrier-specific parsers must imple
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import inspect
+import os
+import pickle
+import re
+import openpyxl
 import pandas as pd
-from typing import Dict, Any, List
-from datetime import datetime
+import numpy as np
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from datetime import date, datetime
+
+# Formatted amount such as '$1,234.50', '-$5', '($100.00)'
+AMOUNT_PATTERN = re.compile(
+    r'^\s*(?P<open>\()?\s*(?P<sign>-)?\s*\$?\s*(?P<inner_sign>-)?\s*'
+    r'(?P<number>[0-9][0-9,]*(?:\.[0-9]*)?|\.[0-9]+)\s*(?P<close>\))?\s*$'
+)
+
+# Supported date string formats keyed by (separator, year first)
+DATE_FORMATS = {
+    ('-', True): '%Y-%m-%d',
+    ('-', False): '%d-%m-%Y',
+    ('/', True): '%Y/%m/%d',
+    ('/', False): '%m/%d/%Y',
+}
+
+# Day zero of Excel's serial date numbering (serial 1 is 1899-12-31)
+EXCEL_EPOCH = datetime(1899, 12, 30)
+
+# Valid Excel serial dates: 1900-01-01 through 9999-12-31
+EXCEL_SERIAL_MIN = 1
+EXCEL_SERIAL_MAX = 2958465
+
+# Prefer the Rust-based calamine reader when installed
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+# Sheets with at least this many rows are streamed instead of read via pandas
+STREAM_ROW_THRESHOLD = 10000
+
+# Cell text that read_excel treats as missing by default
+NA_STRINGS = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+])
+
+# Keep text columns in Arrow string buffers when pyarrow is installed
+try:
+    import pyarrow  # noqa: F401
+    TEXT_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    TEXT_DTYPE = pd.StringDtype()
+
+# Opt-in cache of parsed results, enabled by setting PARSE_CACHE_DIR to a
+# directory. Cached results are pickles, so only point it at a trusted location
+PARSE_CACHE_DIR = os.environ.get('PARSE_CACHE_DIR', '')
+
+@lru_cache(maxsize=None)
+def parser_fingerprint(parser_class: type) -> str:
+    """
+    Fingerprint a parser's code and source schema
+    
+    Args:
+        parser_class: Carrier parser class
+        
+    Returns:
+        str: Hash of the base and carrier parser modules, SOURCE_SCHEMA and
+        pandas version, so any change to parsing logic invalidates cached results
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted({os.path.abspath(__file__), os.path.abspath(inspect.getfile(parser_class))}):
+        digest.update(Path(path).read_bytes())
+    digest.update(repr(sorted(parser_class.SOURCE_SCHEMA.items())).encode())
+    digest.update(pd.__version__.encode())
+    return digest.hexdigest()
+
+@lru_cache(maxsize=256)
+def period_from_filename(file_path: str) -> str:
+    """
+    Extract the commission period from a carrier file name
+    Expected filename format: '<Carrier> MM.YYYY Commission.xlsx'
+    
+    Args:
+        file_path: Path to the carrier file
+        
+    Returns:
+        str: Commission period in 'YYYY-MM' format, '2024-06' if unparseable
+        
+    Example:
+        'Centene 06.2024 Commission.xlsx' -> '2024-06'
+    """
+    try:
+        month_year = Path(file_path).name.split(' ')[1]  # Extract '06.2024' part
+        month, year = month_year.split('.')
+        return f"{year}-{month.zfill(2)}"  # Ensure month is 2 digits
+    except Exception as e:
+        print(f"Warning: Unable to parse period from filename: {e}")
+        return "2024-06"  # Default fallback value
 
 class BaseCommissionParser(ABC):
     """
@@ -18,6 +117,33 @@ class BaseCommissionParser(ABC):
     - Ensure consistent output format
     """
     
+    # Source columns read from the carrier file and their dtypes; empty reads all
+    # columns. Amount and date columns stay 'object' so mixed formats survive
+    # until the vectorized cleaners handle them.
+    SOURCE_SCHEMA: Dict[str, str] = {}
+    
+    # Source columns a file must contain; other SOURCE_SCHEMA columns are
+    # optional and read as all missing when absent
+    REQUIRED_SOURCE_COLUMNS: Tuple[str, ...] = ()
+    
+    # Standardized output columns, in order
+    STANDARD_COLUMNS = (
+        'carrier_name',          # Insurance carrier name
+        'commission_period',     # Commission period
+        'agent_name',            # Agent name
+        'agency_name',           # Agency name
+        'member_id',             # Member ID
+        'member_name',           # Member name
+        'plan_name',             # Plan name
+        'enrollment_date',       # Enrollment date
+        'disenrollment_date',    # Disenrollment date
+        'commission_amount',     # Commission amount
+        'transaction_type',      # Transaction type
+        'policy_number',         # Policy number
+        'effective_date',        # Effective date
+        'processed_date'         # Processing date
+    )
+    
     def __init__(self, file_path: str):
         """
         Initialize parser with data file path
@@ -36,12 +162,132 @@ class BaseCommissionParser(ABC):
             Exception: If file cannot be read
         """
         try:
-            self.raw_data = pd.read_excel(self.file_path)
+            # Only materialize known source columns, with declared dtypes
+            read_options = {}
+            if self.SOURCE_SCHEMA:
+                read_options['usecols'] = lambda column: column in self.SOURCE_SCHEMA
+                read_options['dtype'] = {
+                    column: TEXT_DTYPE if dtype == 'string' else dtype
+                    for column, dtype in self.SOURCE_SCHEMA.items()
+                }
+            
+            if EXCEL_ENGINE == 'calamine':
+                self.raw_data = pd.read_excel(self.file_path, engine='calamine', **read_options)
+            else:
+                # Read-only mode streams cell values without loading styles.
+                # One handle serves both the size check and the read
+                workbook = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+                try:
+                    if self.get_row_count(workbook) >= STREAM_ROW_THRESHOLD:
+                        self.raw_data = self.read_streamed(workbook, read_options.get('dtype', {}))
+                    else:
+                        self.raw_data = pd.read_excel(workbook, engine='openpyxl', **read_options)
+                finally:
+                    workbook.close()
             print(f"Successfully read Excel file: {self.file_path}")
             print(f"Raw data columns: {self.raw_data.columns.tolist()}")
         except Exception as e:
             raise Exception(f"Error reading Excel file {self.file_path}: {str(e)}")
     
+    @staticmethod
+    def get_row_count(workbook: openpyxl.Workbook) -> int:
+        """
+        Get the row count recorded in the first worksheet's dimensions
+        
+        Args:
+            workbook: Open read-only workbook
+            
+        Returns:
+            int: Number of rows including the header, 0 if not recorded
+        """
+        return workbook.worksheets[0].max_row or 0
+    
+    def stream_rows(self, workbook: openpyxl.Workbook) -> Iterator[Dict[str, Any]]:
+        """
+        Stream data rows from the first worksheet
+        
+        Args:
+            workbook: Open read-only workbook
+            
+        Yields:
+            Dict[str, Any]: Cell values keyed by header, limited to
+            SOURCE_SCHEMA columns when a schema is declared
+            
+        Only one row is held in memory at a time. Blank rows are skipped.
+        """
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, ())
+        keep = [
+            (i, name) for i, name in enumerate(header)
+            if name is not None and (not self.SOURCE_SCHEMA or name in self.SOURCE_SCHEMA)
+        ]
+        for row in rows:
+            if any(value is not None for value in row):
+                yield {name: row[i] if i < len(row) else None for i, name in keep}
+    
+    def read_streamed(self, workbook: openpyxl.Workbook, dtypes: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Build the raw DataFrame from streamed rows, bypassing pandas read_excel
+        
+        Args:
+            workbook: Open read-only workbook
+            dtypes: Target dtype per column; other columns stay 'object'
+            
+        Returns:
+            pd.DataFrame: Raw source data
+        """
+        columns: Dict[str, List[Any]] = {}
+        for row in self.stream_rows(workbook):
+            if not columns:
+                columns = {name: [] for name in row}
+            for name, values in columns.items():
+                values.append(row[name])
+        
+        # Empty cells and NA markers become NaN, matching read_excel
+        data = {}
+        for name, values in columns.items():
+            series = pd.Series(values, dtype=object)
+            series = series.mask(series.isna() | series.isin(NA_STRINGS), np.nan)
+            data[name] = series.astype(dtypes.get(name, object))
+        return pd.DataFrame(data)
+    
+    def check_source_columns(self) -> None:
+        """
+        Verify the raw data contains every REQUIRED_SOURCE_COLUMNS column
+        
+        Raises:
+            ValueError: If any required source column is missing
+        """
+        missing = [column for column in self.REQUIRED_SOURCE_COLUMNS if column not in self.raw_data.columns]
+        if missing:
+            raise ValueError(f"{self.get_carrier_name()} missing source columns: {missing}")
+    
+    def get_source_column(self, column: str) -> pd.Series:
+        """
+        Get a raw source column
+        
+        Args:
+            column: Column name in the carrier file
+            
+        Returns:
+            pd.Series: Raw column values, all missing if the file lacks the column
+        """
+        if column in self.raw_data.columns:
+            return self.raw_data[column]
+        return pd.Series(np.nan, index=self.raw_data.index, dtype=object)
+    
+    def get_source_text(self, column: str) -> pd.Series:
+        """
+        Get a raw source column as stripped strings
+        
+        Args:
+            column: Column name in the carrier file
+            
+        Returns:
+            pd.Series: Stripped string values, missing cells kept as NA
+        """
+        return self.get_source_column(column).astype(TEXT_DTYPE).str.strip()
+    
     @abstractmethod
     def get_carrier_name(self) -> str:
         """
@@ -75,6 +321,26 @@ class BaseCommissionParser(ABC):
         """
         pass
     
+    def get_cache_path(self) -> Optional[Path]:
+        """
+        Get the parse cache location for the input file
+        
+        Returns:
+            Optional[Path]: Cache file keyed on path, size, mtime and parser
+            code fingerprint, None if caching is disabled
+        """
+        if not PARSE_CACHE_DIR:
+            return None
+        
+        stat = os.stat(self.file_path)
+        key = hashlib.blake2b(
+            f"{os.path.abspath(self.file_path)}-{stat.st_size}-{stat.st_mtime_ns}-"
+            f"{type(self).__name__}-{self.get_carrier_name()}-"
+            f"{parser_fingerprint(type(self))}".encode(),
+            digest_size=16
+        ).hexdigest()
+        return Path(PARSE_CACHE_DIR) / f"{key}.pkl"
+    
     def parse(self) -> pd.DataFrame:
         """
         Main parsing process implementation
@@ -83,13 +349,22 @@ class BaseCommissionParser(ABC):
             pd.DataFrame: Parsed and validated data
             
         Process:
-        1. Read input file
-        2. Execute carrier-specific parsing
-        3. Add required fields
-        4. Validate output
+        1. Return cached result if the file is unchanged since last parse
+        2. Read input file
+        3. Execute carrier-specific parsing
+        4. Add required fields
+        5. Validate output and store it in the cache
         """
         try:
             print(f"\nStarting to parse {self.get_carrier_name()} data...")
+            cache_path = self.get_cache_path()
+            if cache_path is not None and cache_path.exists():
+                df = self._read_cache(cache_path)
+                if isinstance(df, pd.DataFrame) and list(df.columns) == list(self.STANDARD_COLUMNS):
+                    print(f"Loaded cached parse result: {cache_path}, data shape: {df.shape}")
+                    return df
+                print(f"Warning: Ignoring unexpected parse cache contents: {cache_path}")
+            
             self.read_excel()
             
             # Execute parsing
@@ -108,45 +383,201 @@ class BaseCommissionParser(ABC):
             self.validate_data(df)
             print(f"Data validation passed, final columns: {df.columns.tolist()}")
             
+            if cache_path is not None:
+                self._write_cache(df, cache_path)
+            
             return df
             
         except Exception as e:
             print(f"Parsing error: {str(e)}")
             raise Exception(f"Error parsing file {self.file_path}: {str(e)}")
     
-    def standardize_date(self, date_value: Any) -> str:
+    @staticmethod
+    def _read_cache(cache_path: Path) -> Any:
+        """
+        Load a cached parse result, discarding entries that cannot be read
+        
+        Args:
+            cache_path: Cache file to load
+            
+        Returns:
+            Any: Unpickled cache contents, or None if the entry is corrupt or
+                was written by an incompatible pandas version
+        """
+        try:
+            return pd.read_pickle(cache_path)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError,
+                ValueError, OSError) as e:
+            print(f"Warning: Discarding unreadable parse cache {cache_path}: {e}")
+            try:
+                cache_path.unlink()
+            except OSError:
+                pass
+            return None
+    
+    @staticmethod
+    def _write_cache(df: pd.DataFrame, cache_path: Path) -> None:
+        """
+        Store a parse result in the cache, ignoring filesystem errors
+        
+        Args:
+            df: Parsed and validated data
+            cache_path: Destination cache file
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent parsers never read a partial file
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Unable to write parse cache {cache_path}: {e}")
+    
+    @staticmethod
+    def clean_amount_series(amounts: pd.Series) -> pd.Series:
+        """
+        Clean and standardize a column of commission amounts
+        
+        Args:
+            amounts: Raw commission amount values
+            
+        Returns:
+            pd.Series: Float amounts, 0.0 where missing or invalid
+            
+        Handles:
+        - Numeric columns (returned directly)
+        - String formatting with currency symbols ($)
+        - Negative amounts in parentheses
+        - Comma-separated numbers
+        """
+        if pd.api.types.is_numeric_dtype(amounts):
+            return amounts.astype(float).fillna(0.0)
+        
+        cleaned = pd.to_numeric(amounts, errors='coerce')
+        
+        # Only formatted strings need text cleanup, done in one regex pass.
+        # Amounts repeat heavily, so each distinct string is parsed once.
+        pending = cleaned.isna() & amounts.notna()
+        if pending.any():
+            codes, distinct = pd.factorize(amounts[pending].astype(str))
+            parts = pd.Series(distinct).str.extract(AMOUNT_PATTERN)
+            values = pd.to_numeric(parts['number'].str.replace(',', '', regex=False), errors='coerce')
+            
+            # Negative amounts use one minus sign or parentheses: (100) -> -100
+            has_open, has_close = parts['open'].notna(), parts['close'].notna()
+            sign_count = (
+                (has_open & has_close).astype(int)
+                + parts['sign'].notna().astype(int)
+                + parts['inner_sign'].notna().astype(int)
+            )
+            values = values.mask((has_open != has_close) | (sign_count > 1))
+            values = values.mask(sign_count == 1, -values)
+            cleaned.loc[pending] = values.to_numpy()[codes]
+        
+        return cleaned.fillna(0.0).astype(float)
+    
+    @staticmethod
+    def clean_amount_scalar(amount: Any) -> float:
+        """
+        Clean and standardize a single commission amount
+        
+        Args:
+            amount: Raw commission amount (can be string, int, float or None)
+            
+        Returns:
+            float: Cleaned commission amount, 0.0 if invalid
+            
+        Applies clean_amount_series to a one-element column so scalar and
+        column results always agree.
+        """
+        return float(BaseCommissionParser.clean_amount_series(pd.Series([amount], dtype=object)).iat[0])
+    
+    def standardize_date(self, date_value: Any) -> Optional[str]:
         """
-        Standardize date format to YYYY-MM-DD
+        Standardize a single date to YYYY-MM-DD
         
         Args:
             date_value: Input date in various formats
             
         Returns:
-            str: Standardized date string, None if invalid
+            Optional[str]: Standardized date string, None if invalid
             
-        Supports:
-        - datetime objects
-        - String dates in common formats 
-        - Handles invalid dates
+        Applies standardize_date_series to a one-element column so scalar
+        and column results always agree.
         """
-        if pd.isna(date_value):
-            return None
+        result = self.standardize_date_series(pd.Series([date_value], dtype=object)).iat[0]
+        return None if pd.isna(result) else result
+    
+    @staticmethod
+    def standardize_date_series(dates: pd.Series) -> pd.Series:
+        """
+        Standardize a column of dates to YYYY-MM-DD
         
-        if isinstance(date_value, datetime):
-            return date_value.strftime('%Y-%m-%d')
+        Args:
+            dates: Input dates in various formats
+            
+        Returns:
+            pd.Series: Standardized date strings, missing if invalid
+            
+        Each text date is parsed once with the DATE_FORMATS entry picked by
+        its separator and leading field width, one vectorized pass per format.
+        Datetime values pass through and numbers are read as Excel serial dates.
+        """
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            return dates.dt.strftime('%Y-%m-%d')
         
-        if isinstance(date_value, str):
-            try:
-                # Try multiple common date formats
-                for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d-%m-%Y', '%Y/%m/%d']:
-                    try:
-                        return datetime.strptime(date_value, fmt).strftime('%Y-%m-%d')
-                    except ValueError:
-                        continue
-            except Exception:
-                return None
+        if pd.api.types.is_numeric_dtype(dates) and not pd.api.types.is_bool_dtype(dates):
+            return BaseCommissionParser._excel_serials_to_datetime(dates).dt.strftime('%Y-%m-%d')
+        
+        parsed = np.full(len(dates), np.datetime64('NaT'), dtype='datetime64[us]')
+        present = dates.notna().to_numpy()
+        is_text = present & dates.map(lambda v: isinstance(v, str), na_action='ignore').to_numpy(dtype=bool, na_value=False)
+        
+        # Dispatch each text date to its one candidate format by separator
+        # and whether a 4-digit year leads, so every value is parsed once
+        if is_text.any():
+            positions = np.flatnonzero(is_text)
+            text = dates.iloc[positions].astype(str)
+            dash, slash = text.str.find('-').to_numpy(), text.str.find('/').to_numpy()
+            separator = np.where(dash >= 0, '-', np.where(slash >= 0, '/', ''))
+            year_first = np.where(dash >= 0, dash, slash) == 4
+            for (fmt_separator, fmt_year_first), fmt in DATE_FORMATS.items():
+                rows = (separator == fmt_separator) & (year_first == fmt_year_first)
+                if rows.any():
+                    parsed[positions[rows]] = pd.to_datetime(text[rows], format=fmt, errors='coerce').to_numpy()
         
-        return None
+        # Datetime cells pass through; other numbers are Excel serial dates
+        others = present & ~is_text
+        if others.any():
+            leftover = dates[others]
+            is_date = leftover.map(lambda v: isinstance(v, (date, np.datetime64)))
+            is_number = leftover.map(
+                lambda v: isinstance(v, (int, float, np.integer, np.floating)) and not isinstance(v, (bool, np.bool_))
+            )
+            serials = pd.to_numeric(leftover.where(is_number), errors='coerce')
+            converted = pd.to_datetime(leftover.where(is_date), errors='coerce').fillna(
+                BaseCommissionParser._excel_serials_to_datetime(serials)
+            )
+            parsed[others] = converted.to_numpy()
+        
+        parsed = pd.Series(parsed, index=dates.index)
+        return parsed.dt.strftime('%Y-%m-%d')
+    
+    @staticmethod
+    def _excel_serials_to_datetime(serials: pd.Series) -> pd.Series:
+        """
+        Convert Excel serial date numbers to datetimes
+        
+        Args:
+            serials: Numeric serial dates
+            
+        Returns:
+            pd.Series: Datetimes, NaT outside Excel's serial range (e.g.
+            YYYYMMDD integers), which would otherwise overflow
+        """
+        serials = serials.astype(float)
+        serials = serials.where(serials.between(EXCEL_SERIAL_MIN, EXCEL_SERIAL_MAX))
+        return pd.to_datetime(serials, unit='D', origin=EXCEL_EPOCH, errors='coerce')
     
     def validate_data(self, df: pd.DataFrame) -> bool:
         """
@@ -180,11 +611,12 @@ class BaseCommissionParser(ABC):
             print(f"Current columns: {df.columns.tolist()}")
             raise ValueError(f"Missing required columns: {missing_columns}")
         
-        # Validate commission amounts
-        invalid_amounts = ~pd.to_numeric(df['commission_amount'], errors='coerce').notna()
-        if invalid_amounts.any():
-            print(f"Warning: Found {invalid_amounts.sum()} invalid commission amount records")
-            df.loc[invalid_amounts, 'commission_amount'] = 0.0
+        # Validate commission amounts with a single coercion pass
+        amounts = pd.to_numeric(df['commission_amount'], errors='coerce')
+        invalid_count = amounts.isna().sum()
+        if invalid_count:
+            print(f"Warning: Found {invalid_count} invalid commission amount records")
+        df['commission_amount'] = amounts.fillna(0.0).astype('float64')
         
         print("Data validation complete")
         return True
@@ -202,19 +634,4 @@ class BaseCommissionParser(ABC):
         - Commission details  
         - Dates and other metadata
         """
-        return [
-            'carrier_name',          # Insurance carrier name
-            'commission_period',      # Commission period
-            'agent_name',            # Agent name
-            'agency_name',           # Agency name
-            'member_id',             # Member ID
-            'member_name',           # Member name
-            'plan_name',             # Plan name
-            'enrollment_date',       # Enrollment date
-            'disenrollment_date',    # Disenrollment date
-            'commission_amount',     # Commission amount
-            'transaction_type',      # Transaction type
-            'policy_number',         # Policy number
-            'effective_date',        # Effective date
-            'processed_date'         # Processing date
-        ]
\ No newline at end of file
+        return list(self.STANDARD_COLUMNS)
\ No newline at end of file
@@ -6,9 +6,7 @@ Handles parsing and standardization of Healthfirst commission data files
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Any
-from pathlib import Path
-from src.parser.base_parser import BaseCommissionParser
+from src.parser.base_parser import BaseCommissionParser, period_from_filename
 
 class HealthfirstParser(BaseCommissionParser):
     """
@@ -16,16 +14,30 @@ class HealthfirstParser(BaseCommissionParser):
     Implements specific data format and business rules for Healthfirst
     """
     
+    SOURCE_SCHEMA = {
+        'Producer Name': 'string',
+        'Producer Type': 'string',
+        'Member ID': 'string',
+        'Member Name': 'string',
+        'Product': 'string',
+        'Member Effective Date': 'object',
+        'Disenrolled Date': 'object',
+        'Amount': 'object',
+        'Enrollment Type': 'string'
+    }
+    
+    # Columns behind the required agent_name and commission_amount fields
+    REQUIRED_SOURCE_COLUMNS = ('Producer Name', 'Amount')
+    
     def __init__(self, file_path: str):
         """
-        Initialize parser with file path and setup caching
+        Initialize Healthfirst parser
         
         Args:
             file_path: Path to input Excel file
         """
         super().__init__(file_path)
         self._carrier_name = "Healthfirst"
-        self._commission_period = None  # Cache commission period
     
     def get_carrier_name(self) -> str:
         """Get carrier name identifier"""
@@ -33,89 +45,32 @@ class HealthfirstParser(BaseCommissionParser):
     
     def get_commission_period(self) -> str:
         """
-        Extract commission period from filename using caching
+        Extract commission period from filename
+        Expected filename format: 'Healthfirst MM.YYYY Commission.xlsx'
         
         Returns:
-            str: Commission period in 'YYYY-MM' format
-            
-        Uses caching to avoid repeated filename parsing
+            str: Commission period in 'YYYY-MM' format, from period_from_filename
+            (memoized per file path at module level)
         """
-        if self._commission_period is None:
-            try:
-                # Parse once and cache result
-                filename = Path(self.file_path).name
-                period_part = filename.split(' ')[1]  
-                month, year = period_part.split('.')
-                self._commission_period = f"{year}-{month.zfill(2)}"
-            except Exception as e:
-                print(f"Warning: Unable to parse period from filename: {e}")
-                self._commission_period = "2024-06"  # Default value
-                
-        return self._commission_period
+        return period_from_filename(self.file_path)
     
-    def _clean_commission_amount(self, amount: Any) -> float:
-        """
-        Clean and standardize commission amounts
-        
-        Args:
-            amount: Raw commission amount value
-            
-        Returns:
-            float: Standardized amount value, 0.0 if invalid
-            
-        Handles:
-        - Missing/null values
-        - String formats with currency symbols
-        - Negative amounts in parens or with minus
-        - Invalid/non-numeric values
+    def _clean_agent_names(self, column: str) -> pd.Series:
         """
-        try:
-            if pd.isna(amount):
-                return 0.0
-            
-            if isinstance(amount, (int, float)):
-                return float(amount)
-            
-            if isinstance(amount, str):
-                # Remove currency formatting
-                amount = amount.replace('$', '').replace(',', '').strip()
-                
-                # Handle negative values 
-                if amount.startswith('(') and amount.endswith(')'):
-                    amount = '-' + amount[1:-1]
-                if amount.startswith('-$'): 
-                    amount = '-' + amount[2:]
-                    
-                # Keep only valid numeric characters
-                cleaned = ''.join(c for c in amount if c.isdigit() or c in '.-')
-                return float(cleaned or 0)
-                
-        except Exception as e:
-            print(f"Warning: Invalid amount format '{amount}': {e}")
-            
-        return 0.0
-
-    def _clean_agent_name(self, name: Any) -> str:
-        """
-        Clean and standardize agent names
+        Clean and standardize a column of agent names
         
         Args:
-            name: Raw agent name value
+            column: Source column name
             
         Returns:
-            str: Cleaned agent name or None if invalid
+            pd.Series: Cleaned agent names, NA where missing or blank
             
         Steps:
-        1. Handle missing/invalid values
-        2. Strip whitespace
+        1. Strip and collapse whitespace
+        2. Treat blank values as missing
         3. Standardize capitalization
         """
-        if pd.isna(name) or not str(name).strip():
-            return None  
-            
-        name = str(name).strip()
-        name = " ".join(word.capitalize() for word in name.split())
-        return name
+        names = self.get_source_text(column).str.replace(r'\s+', ' ', regex=True)
+        return names.mask(names.str.len() == 0).str.title()
 
     def _parse_impl(self) -> pd.DataFrame:
         """
@@ -125,9 +80,9 @@ class HealthfirstParser(BaseCommissionParser):
             pd.DataFrame: Parsed and standardized commission data
             
         Process:
-        1. Copy raw data
+        1. Verify source columns
         2. Print debug info
-        3. Process records with error handling
+        3. Map source columns to standard fields
         4. Standardize fields and formats  
         5. Validate output
         """
@@ -139,51 +94,39 @@ class HealthfirstParser(BaseCommissionParser):
         print(self.raw_data.head())
         
         try:
-            df = self.raw_data.copy()
-            standardized_data = []
+            # Fail fast on files that lack required columns
+            self.check_source_columns()
             
-            # Process each record
-            for index, row in df.iterrows():
-                try:
-                    # Extract agent name with fallback to agency
-                    agent_name = self._clean_agent_name(row.get('Producer Name'))
-                    if not agent_name:
-                        agency_name = self._clean_agent_name(row.get('Producer Type'))
-                        agent_name = agency_name if agency_name else "Unknown Agent"
-                    
-                    # Map Healthfirst-specific fields to standard format
-                    record = {
-                        'carrier_name': self.get_carrier_name(),
-                        'commission_period': self.get_commission_period(),
-                        'agent_name': agent_name,
-                        'agency_name': '', 
-                        'member_id': str(row.get('Member ID', '')).strip(),
-                        'member_name': str(row.get('Member Name', '')).strip(),
-                        'plan_name': str(row.get('Product', '')).strip(),
-                        'enrollment_date': self.standardize_date(row.get('Member Effective Date')),
-                        'disenrollment_date': self.standardize_date(row.get('Disenrolled Date')),
-                        'commission_amount': self._clean_commission_amount(row.get('Amount')),
-                        'transaction_type': str(row.get('Enrollment Type', '')).strip(),
-                        'policy_number': '',
-                        'effective_date': self.standardize_date(row.get('Member Effective Date')),
-                        'processed_date': None
-                    }
-                    
-                    standardized_data.append(record)
-                    
-                    # Progress logging
-                    if (index + 1) % 1000 == 0:
-                        print(f"Processed {index + 1} records...")
-                    
-                except Exception as e:
-                    print(f"Error processing row {index + 2}: {str(e)}")
-                    continue
+            df = self.raw_data  # Read-only; output columns are built fresh
             
-            if not standardized_data:
+            if df.empty:
                 raise Exception(f"No data could be parsed from {self.file_path}")
-                
-            # Create DataFrame
-            result = pd.DataFrame(standardized_data)
+            
+            # Extract agent name with fallback to agency
+            agent_name = (
+                self._clean_agent_names('Producer Name')
+                .fillna(self._clean_agent_names('Producer Type'))
+                .fillna("Unknown Agent")
+            )
+            
+            # Map Healthfirst-specific fields to standard format, column by column
+            effective_date = self.standardize_date_series(self.get_source_column('Member Effective Date'))
+            result = pd.DataFrame({
+                'carrier_name': self.get_carrier_name(),
+                'commission_period': self.get_commission_period(),
+                'agent_name': agent_name,
+                'agency_name': '', 
+                'member_id': self.get_source_text('Member ID'),
+                'member_name': self.get_source_text('Member Name'),
+                'plan_name': self.get_source_text('Product'),
+                'enrollment_date': effective_date,
+                'disenrollment_date': self.standardize_date_series(self.get_source_column('Disenrolled Date')),
+                'commission_amount': self.clean_amount_series(self.get_source_column('Amount')),
+                'transaction_type': self.get_source_text('Enrollment Type'),
+                'policy_number': '',
+                'effective_date': effective_date,
+                'processed_date': None
+            }, index=df.index, columns=self.STANDARD_COLUMNS)
             
             # Print summary stats
             print(f"\n{self.get_carrier_name()} parsing complete:")
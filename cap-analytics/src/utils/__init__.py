@@ -2,6 +2,7 @@
 Utility functions module providing general helper functions
 """
 
-from .name_matcher import normalize_name, are_similar_names, match_names
+from .name_matcher import normalize_name, normalize_names_vectorized, are_similar_names, match_names
+from .csv_writer import write_csv
 
-__all__ = ['normalize_name', 'are_similar_names', 'match_names']
\ No newline at end of file
+__all__ = ['normalize_name', 'normalize_names_vectorized', 'are_similar_names', 'match_names', 'write_csv']
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+CSV Export Utilities
+Writes DataFrames to CSV, using PyArrow's multi-threaded writer when available
+"""
+
+import pandas as pd
+
+def write_csv(data: pd.DataFrame, csv_path) -> None:
+    """
+    Write a DataFrame to CSV without the index
+    
+    Args:
+        data: Data to write
+        csv_path: Output file path
+    
+    Uses pyarrow.csv when pyarrow is installed and DataFrame.to_csv otherwise.
+    Both paths produce the same file: floats and booleans are formatted the
+    way pandas formats them, and values are only quoted when they contain a
+    delimiter, quote or newline. Frames pyarrow cannot write that way (such as
+    datetime or mixed-type columns, or values needing quotes) go to to_csv.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        data.to_csv(csv_path, index=False)
+        return
+    
+    try:
+        table = pa.Table.from_pandas(_format_for_arrow(data), preserve_index=False)
+        if not all(_is_arrow_text_type(field.type) for field in table.schema):
+            raise pa.ArrowTypeError("column types are formatted differently by pyarrow")
+        # pyarrow always quotes the header, so pandas writes it. Quoting style
+        # 'none' raises instead of quoting, leaving quoted values to pandas
+        with open(csv_path, 'wb') as csv_file:
+            csv_file.write(data.head(0).to_csv(index=False).encode('utf-8'))
+            pa_csv.write_csv(table, csv_file, pa_csv.WriteOptions(
+                include_header=False, quoting_style='none'))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        print(f"Falling back to pandas CSV writer: {e}")
+        data.to_csv(csv_path, index=False)
+
+def _format_for_arrow(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Render float and boolean columns as pandas' CSV text
+    
+    Args:
+        data: Data to write
+    
+    Returns:
+        pd.DataFrame: Copy with float and boolean columns as strings, missing
+            values left as missing
+    """
+    formatted = data.copy(deep=False)
+    for position in range(data.shape[1]):
+        values = data.iloc[:, position]
+        if pd.api.types.is_float_dtype(values) or pd.api.types.is_bool_dtype(values):
+            formatted.isetitem(position, values.astype(str).where(values.notna()))
+    return formatted
+
+def _is_arrow_text_type(arrow_type) -> bool:
+    """
+    Check whether pyarrow writes a column type exactly as pandas does
+    
+    Args:
+        arrow_type: pyarrow column type
+    
+    Returns:
+        bool: True for string, integer and all-null columns, and categoricals
+            of those
+    """
+    import pyarrow as pa
+    if pa.types.is_dictionary(arrow_type):
+        return _is_arrow_text_type(arrow_type.value_type)
+    return (pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+            or pa.types.is_integer(arrow_type) or pa.types.is_null(arrow_type))
@@ -3,11 +3,56 @@ Name Matching and Standardization Utilities
 Handles cleaning, matching and deduplication of agent and agency names
 """
 
+import os
 import re
-from typing import List, Tuple, Set
-from difflib import SequenceMatcher
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import combinations, repeat
+from typing import List, Tuple
+import numpy as np
 import pandas as pd
 
+# Prefer RapidFuzz's C implementation of the similarity ratio when installed
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
+# Characters stripped from names before comparison
+SPECIAL_CHARACTERS = re.compile(r'[^\w\s-]')
+
+class _SpecialCharacterTable(dict):
+    """
+    str.translate table that deletes SPECIAL_CHARACTERS, classifying each
+    code point once on first sight so later lookups stay in C
+    """
+    
+    def __missing__(self, code_point: int):
+        self[code_point] = None if SPECIAL_CHARACTERS.match(chr(code_point)) else code_point
+        return self[code_point]
+
+SPECIAL_CHARACTER_TABLE = _SpecialCharacterTable()
+
+# Business suffix words dropped from names, e.g. 'acme inc' -> 'acme'
+BUSINESS_SUFFIXES = frozenset({'inc', 'incorporated', 'corp', 'corporation', 'llc', 'ltd', 'limited'})
+
+# Whole-word suffix match for column-wise normalization
+BUSINESS_SUFFIX_WORD = re.compile(
+    r'(?<!\S)(?:' + '|'.join(sorted(BUSINESS_SUFFIXES)) + r')(?!\S)'
+)
+
+# RapidFuzz can reject a score exactly at the cutoff due to float rounding,
+# so cutoffs are loosened by this much and scores compared to the threshold
+SCORE_CUTOFF_TOLERANCE = 1e-6
+
+# Candidate pair count below which scoring stays in-process even when
+# workers are requested, since starting processes would cost more
+PARALLEL_MIN_PAIRS = 200_000
+
+# Substring length used to block candidate pairs before scoring
+QGRAM_SIZE = 3
+
 def normalize_name(name: str) -> str:
     """
     Standardize name format
@@ -24,28 +69,50 @@ def normalize_name(name: str) -> str:
     3. Remove special characters
     4. Remove common business suffixes
     """
+    if isinstance(name, str):
+        return _normalize_name_text(name)
+    
     if pd.isna(name):
         return ""
     
-    name = str(name).lower().strip()
-    name = " ".join(name.split())
-    name = re.sub(r'[^\w\s-]', '', name)
+    return _normalize_name_text(str(name))
+
+@lru_cache(maxsize=200_000)
+def _normalize_name_text(name: str) -> str:
+    """
+    Standardize a name string, memoized since names repeat heavily
     
-    # Remove common business suffixes
-    replacements = {
-        ' inc ': ' ',
-        ' incorporated ': ' ',
-        ' corp ': ' ',
-        ' corporation ': ' ',
-        ' llc ': ' ',
-        ' ltd ': ' ',
-        ' limited ': ' '
-    }
+    Args:
+        name: Input name text
+        
+    Returns:
+        str: Standardized name
+    """
+    name = name.lower().translate(SPECIAL_CHARACTER_TABLE)
     
-    for old, new in replacements.items():
-        name = name.replace(old, new)
+    # Tokenize once, collapsing whitespace and dropping suffix words anywhere
+    return " ".join(word for word in name.split() if word not in BUSINESS_SUFFIXES)
+
+def normalize_names_vectorized(names: pd.Series) -> pd.Series:
+    """
+    Standardize a column of names, equivalent to normalize_name per value
     
-    return name.strip()
+    Args:
+        names: Input names
+        
+    Returns:
+        pd.Series: Standardized names, empty string where missing
+    """
+    missing = names.isna()
+    cleaned = (
+        names.astype(str)
+        .str.lower()
+        .str.replace(SPECIAL_CHARACTERS, '', regex=True)
+        .str.replace(BUSINESS_SUFFIX_WORD, ' ', regex=True)
+        .str.split()
+        .str.join(' ')
+    )
+    return cleaned.mask(missing, '')
 
 def are_similar_names(name1: str, name2: str, threshold: float = 0.85) -> bool:
     """
@@ -63,8 +130,9 @@ def are_similar_names(name1: str, name2: str, threshold: float = 0.85) -> bool:
     1. Normalize both names
     2. Check exact match
     3. Check substring containment
-    4. Compare common words
-    5. Calculate string similarity ratio
+    4. Calculate token set similarity ratio (word order and repeated
+       words are ignored; a name whose words all appear in the other
+       scores 1.0)
     """
     name1 = normalize_name(name1)
     name2 = normalize_name(name2)
@@ -72,42 +140,329 @@ def are_similar_names(name1: str, name2: str, threshold: float = 0.85) -> bool:
     if not name1 or not name2:
         return False
     
-    if name1 == name2:
+    if name1 == name2 or name1 in name2 or name2 in name1:
         return True
     
-    if name1 in name2 or name2 in name1:
-        return True
+    if fuzz is not None:
+        # Returns 0 as soon as the threshold is out of reach
+        cutoff = (threshold - SCORE_CUTOFF_TOLERANCE) * 100
+        return fuzz.token_set_ratio(name1, name2, score_cutoff=cutoff) >= cutoff
     
-    words1 = set(name1.split())
-    words2 = set(name2.split())
-    common_words = words1.intersection(words2)
+    cutoff = threshold - SCORE_CUTOFF_TOLERANCE
+    return _token_set_ratio(name1, name2, score_cutoff=cutoff) >= cutoff
+
+def _indel_ratio(text1: str, text2: str) -> float:
+    """
+    Symmetric similarity ratio 2 * LCS / (len1 + len2), the measure behind
+    rapidfuzz's fuzz.ratio (scaled to 0-1)
     
-    if len(common_words) >= min(len(words1), len(words2)):
-        return True
+    Args:
+        text1: First string
+        text2: Second string
+        
+    Returns:
+        float: Similarity ratio, 1.0 for two empty strings
+    """
+    total = len(text1) + len(text2)
+    if not total:
+        return 1.0
+    
+    # Bit-parallel LCS length: one bit per character of text1, zero bits
+    # of the final vector mark matched positions
+    masks = {}
+    for position, char in enumerate(text1):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    full = (1 << len(text1)) - 1
+    vector = full
+    for char in text2:
+        matched = vector & masks.get(char, 0)
+        vector = ((vector + matched) | (vector - matched)) & full
+    lcs = len(text1) - bin(vector).count('1')
     
-    similarity = SequenceMatcher(None, name1, name2).ratio()
-    return similarity >= threshold
+    return 2.0 * lcs / total
 
-def match_names(names: List[str], threshold: float = 0.85) -> List[Tuple[str, str]]:
+def _token_set_ratio(name1: str, name2: str, score_cutoff: float = 0.0) -> float:
+    """
+    Token set similarity ratio, the pure Python fallback for
+    rapidfuzz.fuzz.token_set_ratio (scaled to 0-1)
+    
+    Args:
+        name1: First normalized name
+        name2: Second normalized name
+        score_cutoff: Scores below this are returned as 0.0, which lets
+            cheap upper bounds skip the LCS computation
+        
+    Returns:
+        float: Best ratio between the sorted common words alone or with
+        each name's remaining words, 0.0 if below score_cutoff
+    """
+    words1, words2 = set(name1.split()), set(name2.split())
+    common = " ".join(sorted(words1 & words2))
+    rest1 = " ".join(sorted(words1 - words2))
+    rest2 = " ".join(sorted(words2 - words1))
+    
+    if common and (not rest1 or not rest2):
+        return 1.0
+    
+    combined1 = f"{common} {rest1}".strip()
+    combined2 = f"{common} {rest2}".strip()
+    
+    # The common words are a prefix of each combined name, so those two
+    # ratios follow from the lengths alone
+    best = 0.0
+    if common:
+        best = max(
+            2.0 * len(common) / (len(common) + len(combined1)),
+            2.0 * len(common) / (len(common) + len(combined2))
+        )
+    
+    # Upper bounds on the combined names' ratio from their lengths and
+    # shared characters (difflib's real_quick_ratio and quick_ratio); the
+    # LCS only runs if the ratio could still raise the score and reach the cutoff
+    total = len(combined1) + len(combined2)
+    floor = max(best, score_cutoff)
+    if (
+        2.0 * min(len(combined1), len(combined2)) / total >= floor
+        and 2.0 * sum((Counter(combined1) & Counter(combined2)).values()) / total >= floor
+    ):
+        best = max(best, _indel_ratio(combined1, combined2))
+    
+    return best if best >= score_cutoff else 0.0
+
+def _tagged_qgrams(text: str) -> List[Tuple[str, int]]:
+    """
+    Split text into q-grams, numbering repeats so that set overlap
+    counts shared q-grams with multiplicity
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        List[Tuple[str, int]]: (q-gram, occurrence number) pairs
+    """
+    seen = Counter()
+    grams = []
+    for k in range(len(text) - QGRAM_SIZE + 1):
+        gram = text[k:k + QGRAM_SIZE]
+        seen[gram] += 1
+        grams.append((gram, seen[gram]))
+    return grams
+
+def _candidate_pairs(keys: List[str], threshold: float) -> List[List[int]]:
+    """
+    Block name pairs with inverted indexes so only pairs that can pass
+    the are_similar_names rules get scored
+    
+    Args:
+        keys: Normalized names
+        threshold: Similarity threshold
+        
+    Returns:
+        List[List[int]]: For each name, the later names it may match
+        
+    A pair can only be similar if:
+    1. One name contains the other, so it contains the other's first q-gram
+    2. The names share a word (token set ratio of the common words)
+    3. The sorted word strings share enough q-grams for their ratio to
+       reach the threshold (q-gram count filter, with a length filter)
+    """
+    cutoff = threshold - SCORE_CUTOFF_TOLERANCE
+    n = len(keys)
+    
+    word_index = defaultdict(set)    # word -> names with that word
+    gram_index = defaultdict(set)    # q-gram -> names containing it
+    prefix_index = defaultdict(set)  # first q-gram -> names starting with it
+    sorted_index = defaultdict(set)  # tagged q-gram of sorted words -> names
+    length_index = defaultdict(set)  # sorted words length -> names
+    short = set()                    # names shorter than one q-gram
+    
+    words, sorted_keys, sorted_grams = [], [], []
+    for i, key in enumerate(keys):
+        key_words = set(key.split())
+        sorted_key = " ".join(sorted(key_words))
+        words.append(key_words)
+        sorted_keys.append(sorted_key)
+        sorted_grams.append(_tagged_qgrams(sorted_key))
+        if not key:
+            continue
+        
+        for word in key_words:
+            word_index[word].add(i)
+        for k in range(len(key) - QGRAM_SIZE + 1):
+            gram_index[key[k:k + QGRAM_SIZE]].add(i)
+        if len(key) < QGRAM_SIZE:
+            short.add(i)
+        else:
+            prefix_index[key[:QGRAM_SIZE]].add(i)
+        for gram in sorted_grams[i]:
+            sorted_index[gram].add(i)
+        length_index[len(sorted_key)].add(i)
+    
+    candidates = []
+    for i, key in enumerate(keys):
+        if not key:
+            candidates.append([])
+            continue
+        
+        # Containment: names with no q-gram are checked against everything
+        if i in short:
+            found = set(range(i + 1, n))
+        else:
+            found = set(gram_index[key[:QGRAM_SIZE]]) | short
+            for k in range(len(key) - QGRAM_SIZE + 1):
+                found |= prefix_index.get(key[k:k + QGRAM_SIZE], set())
+        
+        # Shared words
+        for word in words[i]:
+            found |= word_index[word]
+        
+        # Ratio of the sorted word strings, for names with no common word.
+        # Ratio >= cutoff bounds the edit distance, and strings within edit
+        # distance d share at least max(len) - q + 1 - q * d q-grams.
+        length = len(sorted_keys[i])
+        shared = Counter()
+        for gram in sorted_grams[i]:
+            shared.update(sorted_index[gram])
+        for other_length, members in length_index.items():
+            total = length + other_length
+            if 2.0 * min(length, other_length) < cutoff * total:
+                continue
+            required = (
+                max(length, other_length) - QGRAM_SIZE + 1
+                - QGRAM_SIZE * int((1.0 - cutoff) * total)
+            )
+            if required <= 0:
+                found |= members
+            else:
+                found.update(j for j in members if shared[j] >= required)
+        
+        candidates.append(sorted(j for j in found if j > i))
+    
+    return candidates
+
+def _score_band(keys: List[str], rows: List[Tuple[int, List[int]]], threshold: float) -> List[List[int]]:
+    """
+    Apply the are_similar_names rules to a band of candidate rows
+    
+    Args:
+        keys: Normalized names
+        rows: (name index, candidate indexes) pairs to score
+        threshold: Similarity threshold
+        
+    Returns:
+        List[List[int]]: Similar candidate indexes for each row
+    """
+    cutoff = threshold - SCORE_CUTOFF_TOLERANCE
+    
+    band_hits = []
+    for i, others in rows:
+        key1 = keys[i]
+        hits = []
+        for j in others:
+            key2 = keys[j]
+            if not key2:
+                continue
+            if key1 in key2 or key2 in key1:
+                hits.append(j)
+            elif fuzz is not None:
+                if fuzz.token_set_ratio(key1, key2, score_cutoff=cutoff * 100) >= cutoff * 100:
+                    hits.append(j)
+            elif _token_set_ratio(key1, key2, score_cutoff=cutoff) >= cutoff:
+                hits.append(j)
+        band_hits.append(hits)
+    
+    return band_hits
+
+def _similar_key_pairs(keys: List[str], threshold: float, workers: int = 1) -> List[Tuple[int, int]]:
+    """
+    Apply the are_similar_names rules to every candidate pair of
+    normalized names
+    
+    Args:
+        keys: Normalized names
+        threshold: Similarity threshold
+        workers: Worker processes for scoring large inputs (-1 for all CPUs)
+        
+    Returns:
+        List[Tuple[int, int]]: Index pairs (i < j) of similar names
+    """
+    rows = list(enumerate(_candidate_pairs(keys, threshold)))
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    
+    if workers <= 1 or sum(len(others) for _, others in rows) < PARALLEL_MIN_PAIRS:
+        bands = [rows]
+        band_hits = [_score_band(keys, rows, threshold)]
+    else:
+        # Interleave rows so every band gets a similar share of the
+        # triangle (early rows have the most candidates)
+        bands = [rows[k::workers] for k in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            band_hits = list(executor.map(_score_band, repeat(keys), bands, repeat(threshold)))
+    
+    return [
+        (i, j)
+        for band, hits_per_row in zip(bands, band_hits)
+        for (i, _), hits in zip(band, hits_per_row)
+        for j in hits
+    ]
+
+def _similar_name_keys(names: List[str], threshold: float, workers: int = 1) -> Tuple[np.ndarray, List[str], List[List[int]]]:
+    """
+    Compare each distinct normalized name only once
+    
+    Args:
+        names: Names to compare
+        threshold: Similarity threshold
+        workers: Worker processes for scoring large inputs (-1 for all CPUs)
+        
+    Returns:
+        Tuple: Key code per name, the distinct normalized names, and for
+        each distinct name the codes of the other names similar to it
+    """
+    keys = normalize_names_vectorized(pd.Series(names, dtype=object))
+    codes, unique_keys = pd.factorize(keys)
+    unique_keys = list(unique_keys)
+    
+    neighbors = [[] for _ in unique_keys]
+    for i, j in _similar_key_pairs(unique_keys, threshold, workers):
+        neighbors[i].append(j)
+        neighbors[j].append(i)
+    
+    return codes, unique_keys, neighbors
+
+def match_names(names: List[str], threshold: float = 0.85, workers: int = 1) -> List[Tuple[str, str]]:
     """
     Find all similar name pairs in a list
     
     Args:
         names: List of names to compare
         threshold: Similarity threshold
+        workers: Worker processes for scoring large inputs (-1 for all
+            CPUs). Values above 1 start a process pool, so callers must be
+            importable under the spawn start method (main guard)
         
     Returns:
         List[Tuple[str, str]]: List of similar name pairs
     """
-    matches = []
-    normalized_names = [(name, normalize_name(name)) for name in names]
+    codes, unique_keys, neighbors = _similar_name_keys(names, threshold, workers)
+    
+    positions = [[] for _ in unique_keys]
+    for position, code in enumerate(codes):
+        positions[code].append(position)
     
-    for i, (name1, norm1) in enumerate(normalized_names):
-        for name2, norm2 in normalized_names[i+1:]:
-            if are_similar_names(norm1, norm2, threshold):
-                matches.append((name1, name2))
+    # Expand key pairs back to name positions; identical non-empty keys
+    # match each other, empty keys match nothing
+    pairs = []
+    for code, members in enumerate(positions):
+        if unique_keys[code]:
+            pairs.extend(combinations(members, 2))
+        for other in neighbors[code]:
+            if other > code:
+                pairs.extend((min(i, j), max(i, j)) for i in members for j in positions[other])
+    pairs.sort()
     
-    return matches
+    return [(names[i], names[j]) for i, j in pairs]
 
 def find_canonical_name(names: List[str]) -> str:
     """
@@ -121,7 +476,7 @@ def find_canonical_name(names: List[str]) -> str:
         
     Selection criteria:
     1. Filter out invalid names
-    2. Sort by number of words, then total length
+    2. Rank by number of words, then total length
     3. Select shortest name as canonical
     """
     if not names:
@@ -131,16 +486,18 @@ def find_canonical_name(names: List[str]) -> str:
     if not valid_names:
         return ""
     
-    sorted_names = sorted(valid_names, key=lambda x: (len(x.split()), len(x)))
-    return sorted_names[0]
+    # min keeps the first of equally ranked names, as a stable sort would
+    return min(valid_names, key=lambda x: (len(x.split()), len(x)))
 
-def group_similar_names(names: List[str], threshold: float = 0.85) -> dict:
+def group_similar_names(names: List[str], threshold: float = 0.85, workers: int = 1) -> dict:
     """
     Group similar names together
     
     Args:
         names: List of names to group
         threshold: Similarity threshold
+        workers: Worker processes for scoring large inputs (-1 for all
+            CPUs), see match_names
         
     Returns:
         dict: Mapping from canonical names to lists of similar names
@@ -151,21 +508,34 @@ def group_similar_names(names: List[str], threshold: float = 0.85) -> dict:
     3. Track processed names to avoid duplicates
     """
     groups = {}
-    processed = set()
+    unique_names = list(dict.fromkeys(names))
+    
+    # Compare every distinct normalized name once up front
+    codes, unique_keys, neighbors = _similar_name_keys(unique_names, threshold, workers)
     
-    for name in names:
-        if name in processed:
+    # Unprocessed names per key; a key's names are all claimed together
+    remaining = defaultdict(list)
+    for position, code in enumerate(codes):
+        remaining[code].append(position)
+    processed = np.zeros(len(unique_names), dtype=bool)
+    
+    for i, name in enumerate(unique_names):
+        if processed[i]:
             continue
-            
-        similar_names = {name}
-        for other_name in names:
-            if other_name != name and other_name not in processed:
-                if are_similar_names(name, other_name, threshold):
-                    similar_names.add(other_name)
-        
-        if similar_names:
-            canonical = find_canonical_name(list(similar_names))
-            groups[canonical] = list(similar_names)
-            processed.update(similar_names)
+        
+        # Group the name with every unprocessed name similar to it
+        processed[i] = True
+        code = codes[i]
+        member_codes = neighbors[code] + ([code] if unique_keys[code] else [])
+        members = sorted(
+            j for member_code in member_codes
+            for j in remaining.pop(member_code, ())
+            if not processed[j]
+        )
+        similar_names = [name] + [unique_names[j] for j in members]
+        
+        canonical = find_canonical_name(similar_names)
+        groups[canonical] = similar_names
+        processed[members] = True
     
     return groups
\ No newline at end of file
@@ -17,11 +17,14 @@ import pytest
 import pandas as pd
 import os
 from pathlib import Path
-from src.parser import CenteneParser, EmblemParser, HealthfirstParser
-from src.normalizer import DataNormalizer
-from src.analyzer import PerformanceAnalyzer
 
-@pytest.fixture
+# Pipeline modules are imported where they are used, so collecting the
+# tests does not pay their import cost
+
+# Fixed carrier categories so per-carrier frames concatenate as categorical
+CARRIER_NAMES = ['Centene', 'Emblem', 'Healthfirst']
+
+@pytest.fixture(scope='session')
 def data_dir():
     """
     Get data file directory fixture
@@ -54,14 +57,14 @@ def parse_carrier_data(parser_class, file_path):
     print(f"\nParsing {parser.get_carrier_name()} data...")
     
     try:
-        parser.read_excel()
-        print(f"Excel file read successfully: {file_path}")
-        
-        data = parser._parse_impl()
+        # Read, parse and validate; reuses the parse cache when PARSE_CACHE_DIR is set
+        data = parser.parse()
         
-        # Add required fields
-        data['carrier_name'] = parser.get_carrier_name()
-        data['commission_period'] = parser.get_commission_period()
+        # Add required fields as categories (one value per file)
+        data['carrier_name'] = pd.Categorical(
+            [parser.get_carrier_name()] * len(data), categories=CARRIER_NAMES
+        )
+        data['commission_period'] = pd.Categorical([parser.get_commission_period()] * len(data))
         
         # Validate data
         assert not data.empty, f"{parser.get_carrier_name()} data cannot be empty"
@@ -82,10 +85,10 @@ def parse_carrier_data(parser_class, file_path):
             print(f"Raw data columns: {parser.raw_data.columns.tolist()}")
         raise
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def parsed_data(data_dir):
     """
-    Fixture to parse all Excel data files
+    Fixture to parse all Excel data files, once per test session
     
     Args:
         data_dir: Directory containing commission files
@@ -98,6 +101,8 @@ def parsed_data(data_dir):
     - Error tracking
     - Progress reporting
     """
+    from src.parser import CenteneParser, EmblemParser, HealthfirstParser
+    
     parsers = [
         (CenteneParser, data_dir / "Centene 06.2024 Commission.xlsx"),
         (EmblemParser, data_dir / "Emblem 06.2024 Commission.xlsx"),
@@ -128,10 +133,27 @@ def get_normalized_data(parsed_data):
     Returns:
         pd.DataFrame: Combined and normalized data
     """
+    from src.normalizer import DataNormalizer
+    
+    # The concat result is fresh, so normalize it in place
     combined_data = pd.concat(parsed_data, ignore_index=True)
-    normalizer = DataNormalizer(combined_data)
+    normalizer = DataNormalizer(combined_data, copy=False)
     return normalizer.normalize()
 
+@pytest.fixture(scope='session')
+def normalized_data(parsed_data):
+    """
+    Fixture to normalize the parsed data, once per test session
+    
+    Args:
+        parsed_data: List of parsed DataFrames
+        
+    Returns:
+        pd.DataFrame: Combined and normalized data (shared; do not modify)
+    """
+    print("\nExecuting data normalization...")
+    return get_normalized_data(parsed_data)
+
 def generate_top_performers_report(normalized_data):
     """
     Generate top 10 agents performance report
@@ -145,6 +167,8 @@ def generate_top_performers_report(normalized_data):
     - Performance details per agent
     - Carrier distribution
     """
+    from src.analyzer import PerformanceAnalyzer
+    
     print("\n" + "="*80)
     print("                     TOP 10 COMMISSION EARNERS - JUNE 2024")
     print("="*80)
@@ -166,17 +190,17 @@ def generate_top_performers_report(normalized_data):
     print("-"*80)
     
     # Print detailed agent information
-    for i, row in top_performers.iterrows():
+    for i, row in enumerate(top_performers.itertuples(index=False)):
         rank = f"{i+1}."
-        name = row['agent_name'] if row['agent_name'] else "N/A"
-        total = f"${row['total_commission']:,.2f}"
-        avg = f"${row['avg_commission']:,.2f}"
-        trans = f"{row['transaction_count']:,}"
+        name = row.agent_name if row.agent_name else "N/A"
+        total = f"${row.total_commission:,.2f}"
+        avg = f"${row.avg_commission:,.2f}"
+        trans = f"{row.transaction_count:,}"
         
         print(f"{rank:4} {name:30} {total:>15} {avg:>15} {trans:>12}")
         # Print carrier information
-        if row['carriers'] != 'N/A':
-            print(f"     Carriers: {row['carriers']}")
+        if row.carriers != 'N/A':
+            print(f"     Carriers: {row.carriers}")
     
     print("-"*80)
     print(f"\nReport Generated: {summary['generated_at']}")
@@ -205,24 +229,23 @@ def test_data_parsing(parsed_data):
         total_records += len(data)
     print(f"Total records: {total_records}")
 
-def test_data_normalization(parsed_data):
+def test_data_normalization(normalized_data):
     """
     Test data normalization process
     
     Args:
-        parsed_data: List of parsed DataFrames
+        normalized_data: Combined and normalized data
         
     Outputs:
     - Normalized CSV file
     - Processing statistics
     """
-    print("\nExecuting data normalization...")
-    normalized_data = get_normalized_data(parsed_data)
+    from src.utils import write_csv
     
     output_dir = Path("data/processed")
     output_dir.mkdir(exist_ok=True)
     csv_path = output_dir / "normalized_commissions.csv"
-    normalized_data.to_csv(csv_path, index=False)
+    write_csv(normalized_data, csv_path)
     
     print("\nNormalization complete:")
     print(f"- Total records: {len(normalized_data):,}")
@@ -230,22 +253,21 @@ def test_data_normalization(parsed_data):
     print(f"- Total commission: ${normalized_data['commission_amount'].sum():,.2f}")
     print(f"- Output file: {csv_path}")
 
-def test_top_performers(parsed_data):
+def test_top_performers(normalized_data):
     """
     Test top performers report generation
     
     Args:
-        parsed_data: List of parsed DataFrames
+        normalized_data: Combined and normalized data
     """
-    normalized_data = get_normalized_data(parsed_data)
     generate_top_performers_report(normalized_data)
 
-def test_deliverables(parsed_data):
+def test_deliverables(normalized_data):
     """
     Execute all deliverables in sequence
     
     Args:
-        parsed_data: List of parsed DataFrames
+        normalized_data: Combined and normalized data
         
     Tests:
     1. Data normalization
@@ -261,10 +283,10 @@ def test_deliverables(parsed_data):
         print("="*50)
         
         print("\n1. Normalizing Commission Data...")
-        test_data_normalization(parsed_data)
+        test_data_normalization(normalized_data)
         
         print("\n2. Generating Top Performers Report...")
-        test_top_performers(parsed_data)
+        test_top_performers(normalized_data)
         
         print("\nAll deliverables completed successfully!")
         
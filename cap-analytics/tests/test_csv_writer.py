@@ -0,0 +1,73 @@
+"""
+CSV Writer Tests
+
+Covers write_csv:
+- Output parity between the pyarrow and pandas writers
+- Fallback to DataFrame.to_csv without pyarrow or on Arrow errors
+- Round trips through read_csv
+"""
+
+import sys
+import pytest
+import pandas as pd
+from src.utils import write_csv
+
+def sample_frame():
+    """
+    Build a frame exercising the formats pyarrow writes differently
+    
+    Returns:
+        pd.DataFrame: Text, float, integer, boolean, categorical and missing values
+    """
+    return pd.DataFrame({
+        'agent_name': ['Jane Doe', 'John Smith', None],
+        'commission_amount': [391.0, 0.1, float('nan')],
+        'large_amount': [123456789012345.0, 1e16, -0.0],
+        'member_count': [1, 2, 3],
+        'active': [True, False, True],
+        'carrier_name': pd.Categorical(['Centene', 'Emblem', 'Centene'])
+    })
+
+@pytest.mark.parametrize('frame', [
+    sample_frame(),
+    pd.DataFrame({'agent_name': ['Doe, Jane', 'Say "hi"'], 'amount': [1.0, 2.5]}),
+    pd.DataFrame({'period': pd.to_datetime(['2024-06-01', '2024-06-02'])})
+], ids=['plain', 'quoted', 'datetime'])
+def test_pyarrow_output_matches_pandas(tmp_path, frame):
+    """The pyarrow writer produces the same file as DataFrame.to_csv"""
+    pytest.importorskip('pyarrow')
+    write_csv(frame, tmp_path / "arrow.csv")
+    frame.to_csv(tmp_path / "pandas.csv", index=False)
+    
+    assert (tmp_path / "arrow.csv").read_text() == (tmp_path / "pandas.csv").read_text()
+
+def test_writes_without_pyarrow(tmp_path, monkeypatch):
+    """DataFrame.to_csv is used when pyarrow cannot be imported"""
+    monkeypatch.setitem(sys.modules, 'pyarrow', None)
+    monkeypatch.setitem(sys.modules, 'pyarrow.csv', None)
+    frame = sample_frame()
+    write_csv(frame, tmp_path / "out.csv")
+    frame.to_csv(tmp_path / "expected.csv", index=False)
+    
+    assert (tmp_path / "out.csv").read_text() == (tmp_path / "expected.csv").read_text()
+
+def test_falls_back_on_arrow_conversion_error(tmp_path, capsys):
+    """Columns pyarrow cannot convert are written by DataFrame.to_csv"""
+    pytest.importorskip('pyarrow')
+    frame = pd.DataFrame({'member_id': [1, 'A-2'], 'amount': [1.5, 2.0]})
+    write_csv(frame, tmp_path / "out.csv")
+    
+    assert "Falling back to pandas CSV writer" in capsys.readouterr().out
+    assert (tmp_path / "out.csv").read_text() == frame.to_csv(index=False)
+
+def test_round_trip(tmp_path):
+    """Written files read back to the original values"""
+    frame = sample_frame()
+    write_csv(frame, tmp_path / "out.csv")
+    result = pd.read_csv(tmp_path / "out.csv")
+    
+    assert result['agent_name'].tolist()[:2] == ['Jane Doe', 'John Smith']
+    assert result['commission_amount'].tolist()[:2] == [391.0, 0.1]
+    assert result['member_count'].tolist() == [1, 2, 3]
+    assert result['active'].tolist() == [True, False, True]
+    assert result['carrier_name'].tolist() == ['Centene', 'Emblem', 'Centene']
@@ -0,0 +1,122 @@
+"""
+Name Matcher Tests
+
+Covers the name matching utilities:
+- Suffix stripping and word-order insensitive matching
+- Pairwise matching with q-gram blocking against brute force
+- Grouping and canonical name selection
+"""
+
+import random
+import pytest
+import pandas as pd
+from src.utils import name_matcher
+from src.utils.name_matcher import (
+    normalize_name, normalize_names_vectorized, are_similar_names,
+    match_names, find_canonical_name, group_similar_names
+)
+
+@pytest.fixture(params=['rapidfuzz', 'python'])
+def scorer(request, monkeypatch):
+    """
+    Run a test with rapidfuzz and with the pure Python fallback scorer
+    
+    Returns:
+        str: Scorer in use
+    """
+    if request.param == 'rapidfuzz':
+        if name_matcher.fuzz is None:
+            pytest.skip("rapidfuzz not installed")
+    else:
+        monkeypatch.setattr(name_matcher, 'fuzz', None)
+    return request.param
+
+def random_names(seed, count=60):
+    """
+    Build a list of short names over a small alphabet, so that
+    containment, shared words and near misses are all common
+    
+    Args:
+        seed: Random seed
+        count: Number of names
+        
+    Returns:
+        list: Names, including a few suffixed, blank and missing entries
+    """
+    rng = random.Random(seed)
+    names = [
+        ' '.join(
+            ''.join(rng.choice('abcd') for _ in range(rng.randint(1, 6)))
+            for _ in range(rng.randint(1, 3))
+        ) + rng.choice(['', '', ' Inc', ', LLC'])
+        for _ in range(count)
+    ]
+    return names + ['', None, 'Inc']
+
+def test_suffixes_removed():
+    """Business suffixes and punctuation are stripped"""
+    assert normalize_name('Acme Inc') == 'acme'
+    assert normalize_name('Acme, LLC') == 'acme'
+    assert normalize_name('  Acme   Corp. Group ') == 'acme group'
+    assert normalize_name(None) == ''
+    assert are_similar_names('Acme Inc', 'Acme, LLC')
+
+def test_vectorized_matches_scalar():
+    """Column-wise normalization agrees with normalize_name"""
+    names = random_names(seed=1)
+    expected = [normalize_name(name) for name in names]
+    assert normalize_names_vectorized(pd.Series(names, dtype=object)).tolist() == expected
+
+def test_word_order_ignored(scorer):
+    """Reordered words still match"""
+    assert are_similar_names('Smith Agency Inc', 'Inc Smith Agency')
+    assert are_similar_names('John Smith', 'Smith John')
+    assert not are_similar_names('John Smith', 'Mary Jones')
+
+def test_similarity_symmetric(scorer):
+    """Argument order does not change the result"""
+    names = [name for name in random_names(seed=2, count=40) if name]
+    for name1 in names:
+        for name2 in names:
+            assert are_similar_names(name1, name2) == are_similar_names(name2, name1)
+
+@pytest.mark.parametrize('threshold', [0.6, 0.85, 0.95])
+@pytest.mark.parametrize('seed', [3, 4, 5])
+def test_match_names_brute_force(scorer, threshold, seed):
+    """Blocked matching finds exactly the pairs a full pairwise scan finds"""
+    names = random_names(seed)
+    expected = [
+        (names[i], names[j])
+        for i in range(len(names))
+        for j in range(i + 1, len(names))
+        if are_similar_names(names[i], names[j], threshold)
+    ]
+    assert match_names(names, threshold) == expected
+
+def test_match_names_workers(monkeypatch):
+    """Parallel scoring returns the serial result"""
+    monkeypatch.setattr(name_matcher, 'PARALLEL_MIN_PAIRS', 0)
+    names = random_names(seed=6)
+    assert match_names(names, workers=2) == match_names(names)
+
+def test_find_canonical_name():
+    """Fewest words wins, then the shortest, then the first seen"""
+    assert find_canonical_name(['Acme Insurance Group LLC', 'Acme Insurance Group']) == 'Acme Insurance Group'
+    assert find_canonical_name(['Beta Agency', 'Beta']) == 'Beta'
+    assert find_canonical_name(['Acme', 'Beta']) == 'Acme'
+    assert find_canonical_name(['', None]) == ''
+    assert find_canonical_name([]) == ''
+
+def test_group_similar_names(scorer):
+    """Similar names share a group keyed by the canonical name"""
+    names = [
+        'Acme Insurance Group LLC', 'Beta Agency', 'Acme Insurance Group',
+        'Agency Beta Inc', 'Zeta Partners', 'Acme Insurance Group LLC'
+    ]
+    groups = group_similar_names(names)
+    
+    assert groups == {
+        'Acme Insurance Group': ['Acme Insurance Group LLC', 'Acme Insurance Group'],
+        'Beta Agency': ['Beta Agency', 'Agency Beta Inc'],
+        'Zeta Partners': ['Zeta Partners']
+    }
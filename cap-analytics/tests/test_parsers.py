@@ -0,0 +1,134 @@
+"""
+Carrier Parser Tests
+
+Covers source column handling and value cleanup:
+- Missing required columns fail before any rows are processed
+- Missing optional columns are read as all missing
+- Dates in text, datetime and Excel serial form
+"""
+
+import pytest
+import pandas as pd
+from datetime import datetime
+from src.parser import CenteneParser
+from src.parser import base_parser
+from src.parser.base_parser import BaseCommissionParser
+
+def write_centene_file(directory, drop_column=None):
+    """
+    Write a small Centene workbook, optionally without one column
+    
+    Args:
+        directory: Directory for the workbook
+        drop_column: Source column to leave out
+        
+    Returns:
+        str: Path to the workbook
+    """
+    data = pd.DataFrame({
+        'Writing Broker Name': ['John Smith', 'Mary Jones'],
+        'Delta Care CORPORATION': ['Delta Care', 'Delta Care'],
+        'Medicare Beneficiary Identifier (MBI)': ['1AB0000', '1AB0001'],
+        'Member Name': ['M0', 'M1'],
+        'Plan Plan Type': ['HMO', 'PPO'],
+        'Effective Date': ['2024-06-01', '06/15/2024'],
+        'Payment Amount': ['$100.00', '250.50'],
+        'Payment Type': ['New', 'Renewal'],
+        'Policy State': ['NY', 'NJ']
+    })
+    if drop_column:
+        data = data.drop(columns=drop_column)
+    
+    file_path = directory / "Centene 06.2024 Commission.xlsx"
+    data.to_excel(file_path, index=False)
+    return str(file_path)
+
+def test_missing_required_column_raises(tmp_path):
+    """A workbook without a required source column is rejected"""
+    parser = CenteneParser(write_centene_file(tmp_path, drop_column='Payment Amount'))
+    parser.read_excel()
+    
+    with pytest.raises(ValueError, match="Payment Amount"):
+        parser._parse_impl()
+
+def test_missing_optional_column_is_empty(tmp_path):
+    """A workbook without an optional source column still parses"""
+    parser = CenteneParser(write_centene_file(tmp_path, drop_column='Policy State'))
+    parser.read_excel()
+    result = parser._parse_impl()
+    
+    assert result['policy_number'].isna().all()
+    assert result['agent_name'].tolist() == ['John Smith', 'Mary Jones']
+    assert result['commission_amount'].tolist() == [100.0, 250.5]
+
+def test_excel_serial_dates():
+    """Numeric columns are read as Excel serial dates within Excel's range"""
+    dates = pd.Series([45444, 45444.75, 20240601, 1e12, -5, None])
+    result = BaseCommissionParser.standardize_date_series(dates)
+    
+    assert result.iloc[:2].tolist() == ['2024-06-01', '2024-06-01']
+    assert result.iloc[2:].isna().all()
+
+def test_mixed_date_column():
+    """Text dates and serial numbers mixed in one column, out-of-range numbers dropped"""
+    dates = pd.Series(['2024-06-01', '06/15/2024', 45444, 20240601, 1e12, 'not a date', None], dtype=object)
+    result = BaseCommissionParser.standardize_date_series(dates)
+    
+    assert result.iloc[:3].tolist() == ['2024-06-01', '2024-06-15', '2024-06-01']
+    assert result.iloc[3:].isna().all()
+
+def test_scalar_date_matches_series(tmp_path):
+    """standardize_date agrees with standardize_date_series value by value"""
+    parser = CenteneParser(str(tmp_path / "Centene 06.2024 Commission.xlsx"))
+    values = [
+        '2024-06-01', '06/15/2024', '15-06-2024', '2024/06/01', '2024-13-01', 'junk',
+        datetime(2024, 6, 1, 5), pd.Timestamp('2024-06-02'), 45444, 45444.5,
+        20240601, 1e12, True, None
+    ]
+    column = BaseCommissionParser.standardize_date_series(pd.Series(values, dtype=object))
+    
+    for value, expected in zip(values, column):
+        assert parser.standardize_date(value) == (None if pd.isna(expected) else expected)
+
+def test_scalar_amount_matches_series():
+    """clean_amount_scalar agrees with clean_amount_series value by value"""
+    values = [
+        '$1,234.50', '(100.00)', '-$5', '$-5', '--5', '(-5)', '(5', '1_000', '１２３',
+        ' 12 ', '.5', 'abc', '', '1e3', 42, 3.25, float('nan'), None
+    ]
+    column = BaseCommissionParser.clean_amount_series(pd.Series(values, dtype=object))
+    
+    assert column.tolist()[:3] == [1234.5, -100.0, -5.0]
+    for value, expected in zip(values, column):
+        assert BaseCommissionParser.clean_amount_scalar(value) == expected
+
+def test_corrupt_cache_falls_back_to_excel(tmp_path, monkeypatch):
+    """An unreadable cache entry is discarded and the file is parsed again"""
+    monkeypatch.setattr(base_parser, 'PARSE_CACHE_DIR', str(tmp_path / "cache"))
+    parser = CenteneParser(write_centene_file(tmp_path))
+    cache_path = parser.get_cache_path()
+    cache_path.parent.mkdir()
+    cache_path.write_bytes(b"not a pickle")
+    
+    df = parser.parse()
+    
+    assert len(df) == 2
+    assert pd.read_pickle(cache_path).equals(df)
+
+@pytest.mark.parametrize('threshold', [1, base_parser.STREAM_ROW_THRESHOLD], ids=['streamed', 'read_excel'])
+def test_openpyxl_read_opens_workbook_once(tmp_path, monkeypatch, threshold):
+    """The row count check and the read share one workbook handle"""
+    load_workbook = base_parser.openpyxl.load_workbook
+    opened = []
+    
+    def counting_load_workbook(*args, **kwargs):
+        opened.append(args)
+        return load_workbook(*args, **kwargs)
+    
+    monkeypatch.setattr(base_parser, 'EXCEL_ENGINE', 'openpyxl')
+    monkeypatch.setattr(base_parser, 'STREAM_ROW_THRESHOLD', threshold)
+    monkeypatch.setattr(base_parser.openpyxl, 'load_workbook', counting_load_workbook)
+    df = CenteneParser(write_centene_file(tmp_path)).parse()
+    
+    assert len(opened) == 1
+    assert len(df) == 2